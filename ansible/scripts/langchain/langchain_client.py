@@ -10,12 +10,636 @@ Usage:
     client = LangChainClient()
     response = client.chat("What is Docker?")
     print(response)
+
+Async usage (requires httpx):
+    from langchain_client import AsyncLangChainClient
+
+    async with AsyncLangChainClient() as client:
+        responses = await client.chat_many(["What is Docker?", "What is K8s?"])
 """
 
-from typing import Optional, Dict, Any, List, Generator
-import requests
+from typing import (
+    TYPE_CHECKING, Optional, Dict, Any, List, Generator, AsyncGenerator, Callable, Sequence,
+    Iterable, Iterator
+)
+from collections import OrderedDict, deque
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+import codecs
+import gzip
+import hashlib
+import importlib.util
+import threading
+import time
 import json
 
+# requests, httpx, numpy and asyncio pull in large dependency trees
+# (urllib3, charset_normalizer, idna, ...), so they are imported on first
+# use and importing this module stays cheap for serverless/hot-reload
+# callers.
+HTTPX_AVAILABLE = importlib.util.find_spec("httpx") is not None
+H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+if TYPE_CHECKING:
+    import asyncio
+    import httpx
+    import numpy as np
+    import requests
+
+
+@lru_cache(maxsize=None)
+def _transport_errors() -> tuple:
+    """Exceptions raised by either HTTP backend for failed requests."""
+    import requests
+
+    errors = (requests.exceptions.RequestException,)
+    if HTTPX_AVAILABLE:
+        import httpx
+        errors += (httpx.HTTPError,)
+    return errors
+
+
+@lru_cache(maxsize=None)
+def _accept_encoding() -> str:
+    """
+    Every response encoding urllib3 can decode here (br/zstd only when the
+    optional brotli/zstandard packages are installed).
+    """
+    from urllib3.util import make_headers
+
+    return make_headers(accept_encoding=True)["accept-encoding"]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily computed module constants."""
+    if name == "TRANSPORT_ERRORS":
+        return _transport_errors()
+    if name == "ACCEPT_ENCODING":
+        return _accept_encoding()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# HTTP libraries LangChainClient can run on
+BACKENDS = ("requests", "httpx")
+
+# chat_stream framing: auto (SSE if the server says so, else raw text),
+# raw (text as it arrives), lines (one item per line), sse (data: payloads)
+STREAM_MODES = ("auto", "raw", "lines", "sse")
+
+# Operations accepted by LangChainClient.batch, named after the client methods
+BATCH_OPS = ("create_memory", "clear_memory", "delete_conversation")
+
+# Fixed API endpoints; full URLs are resolved once per client
+ENDPOINTS = (
+    "/health",
+    "/info",
+    "/chat",
+    "/chat/batch",
+    "/chat/stream",
+    "/rag/query",
+    "/rag/query/batch",
+    "/rag/conversational",
+    "/agent/run",
+    "/agent/troubleshoot",
+    "/summarize",
+    "/summarize/batch",
+    "/summarize/log",
+    "/summarize/config",
+    "/memory/create",
+    "/conversations",
+    "/batch",
+)
+
+# Read size for NDJSON listings; favours throughput over time-to-first-item
+NDJSON_CHUNK_SIZE = 64 * 1024
+
+# Request bodies larger than this are gzip-compressed when enabled
+GZIP_MIN_SIZE = 16 * 1024
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _make_tuned_session(
+    pool_connections: int = 32,
+    pool_maxsize: int = 64,
+    retries: int = 3
+) -> "requests.Session":
+    """
+    Build a Session with a sized connection pool and retry policy.
+
+    The default HTTPAdapter keeps only 10 connections per host, so threaded
+    callers beyond that open and discard sockets on every request. Connect
+    errors and 502/503 responses are retried with exponential backoff.
+    Read errors and 504s are not: both usually mean the service is still
+    working on the request, so resending a POST would run the inference or
+    write a second time.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=retries,
+        read=False,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503),
+        allowed_methods=frozenset(["GET", "POST", "DELETE"]),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "Content-Type": "application/json",
+        "Accept-Encoding": _accept_encoding(),
+        "Connection": "keep-alive"
+    })
+    return session
+
+
+# Process-wide Session and per-URL clients used by LangChainClient.shared()
+_SHARED_SESSION: Optional["requests.Session"] = None
+_SHARED_CLIENTS: Dict[str, "LangChainClient"] = {}
+_SHARED_LOCK = threading.RLock()
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _encode_body(payload: Dict[str, Any], compress: bool) -> tuple:
+    """
+    Serialize a payload, gzip-compressing it when large enough.
+
+    Returns:
+        Tuple of (body bytes, extra request headers)
+    """
+    body = _dumps(payload)
+    if compress and len(body) >= GZIP_MIN_SIZE:
+        # mtime=0 keeps the output deterministic for request coalescing
+        return gzip.compress(body, compresslevel=5, mtime=0), {"Content-Encoding": "gzip"}
+    return body, {}
+
+
+def _flight_key(method: str, path: str, body: Optional[bytes]) -> str:
+    """
+    Identify a request for coalescing by method, path and body.
+
+    In-flight maps are per client, so the base URL is implied.
+    """
+    digest = hashlib.sha256(method.encode("ascii"))
+    digest.update(b"\0" + path.encode("utf-8") + b"\0")
+    digest.update(body or b"")
+    return digest.hexdigest()
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _decode_response(response: Any) -> Any:
+    """
+    Decode a requests/httpx response body.
+
+    JSON is parsed straight from the raw bytes in a single pass, skipping
+    the charset detection and str round-trip of response.json(). Empty
+    bodies decode to None (keyed calls then raise _missing_field_error);
+    anything that is not valid JSON raises the backend's decoding error so
+    callers handle it like any other transport failure.
+    """
+    content = response.content
+    if not content:
+        return None
+    content_type = response.headers.get("Content-Type", "")
+    if not content_type or "json" in content_type:
+        try:
+            return _loads(content)
+        except ValueError:
+            pass
+    message = f"Expected a JSON response, got {content_type or 'no type'}"
+    raise _decoding_error(message, response)
+
+
+def _decoding_error(
+    message: str,
+    response: Any = None,
+    use_httpx: bool = False
+) -> Exception:
+    """
+    Build the JSON decoding error of the backend that served a response.
+
+    Both backends' errors are in TRANSPORT_ERRORS, so a body that cannot
+    be used fails the same way as a refused connection or a 5xx.
+    """
+    if HTTPX_AVAILABLE:
+        import httpx
+
+        if use_httpx or isinstance(response, httpx.Response):
+            request = response.request if response is not None else None
+            return httpx.DecodingError(message, request=request)
+    import requests
+
+    return requests.exceptions.InvalidJSONError(message, response=response)
+
+
+def _missing_field_error(path: str, key: str, use_httpx: bool) -> Exception:
+    """Decoding error for a response (e.g. an empty 204) that lacks key."""
+    message = f"Response from {path} has no {key!r} field"
+    return _decoding_error(message, use_httpx=use_httpx)
+
+
+def _record_metrics(
+    metrics: "ClientMetrics",
+    method: str,
+    path: str,
+    response: Any,
+    body: Optional[bytes],
+    send_ns: int,
+    parse_ns: int,
+    error: Optional[BaseException] = None
+) -> None:
+    """
+    Record one call's timings from a requests/httpx response.
+
+    response is None when the call failed before one arrived (e.g. a
+    timeout or refused connection).
+    """
+    elapsed = getattr(response, "elapsed", None)
+    metrics.record(
+        method,
+        path,
+        send_ns=send_ns,
+        parse_ns=parse_ns,
+        bytes_in=len(response.content) if response is not None else 0,
+        bytes_out=len(body) if body else 0,
+        elapsed_ms=elapsed.total_seconds() * 1000 if elapsed is not None else None,
+        status=response.status_code if response is not None else None,
+        error=type(error).__name__ if error is not None else None
+    )
+
+
+def _record_failure(
+    metrics: "ClientMetrics",
+    method: str,
+    path: str,
+    response: Any,
+    body: Optional[bytes],
+    error: BaseException,
+    t0: int,
+    t1: Optional[int]
+) -> None:
+    """
+    Record a call that raised a transport error.
+
+    t1 marks the end of the send phase when a response had already arrived
+    (the failure was in decoding); otherwise the whole call counts as send.
+    """
+    t2 = time.perf_counter_ns()
+    if t1 is None:
+        t1 = t2
+        if response is None:
+            # HTTP status errors carry the response that raise_for_status saw
+            response = getattr(error, "response", None)
+    _record_metrics(metrics, method, path, response, body, t1 - t0, t2 - t1, error)
+
+
+def _is_ndjson(content_type: Optional[str]) -> bool:
+    """Check whether a Content-Type header denotes newline-delimited JSON."""
+    return bool(content_type) and content_type.split(";", 1)[0].strip() in (
+        "application/x-ndjson",
+        "application/jsonl",
+    )
+
+
+def _is_event_stream(content_type: Optional[str]) -> bool:
+    """Check whether a Content-Type header denotes Server-Sent Events."""
+    return bool(content_type) and content_type.split(";", 1)[0].strip() == "text/event-stream"
+
+
+def _resolve_stream_mode(stream_mode: str, content_type: Optional[str]) -> str:
+    """Pick the concrete framing for a streaming response."""
+    if stream_mode == "auto":
+        return "sse" if _is_event_stream(content_type) else "raw"
+    return stream_mode
+
+
+def _check_stream_mode(stream_mode: str) -> None:
+    """Reject unknown stream modes early."""
+    if stream_mode not in STREAM_MODES:
+        raise ValueError(f"stream_mode must be one of {STREAM_MODES}, got {stream_mode!r}")
+
+
+def _sse_data(line: bytes) -> Optional[bytes]:
+    """Return the payload of an SSE 'data:' line, or None for other lines."""
+    if not line.startswith(b"data:"):
+        return None
+    data = line[5:]
+    return data[1:] if data.startswith(b" ") else data
+
+
+def _get_shared_session() -> "requests.Session":
+    """Return the process-wide tuned Session, creating it on first use."""
+    global _SHARED_SESSION
+    with _SHARED_LOCK:
+        if _SHARED_SESSION is None:
+            _SHARED_SESSION = _make_tuned_session()
+        return _SHARED_SESSION
+
+
+class ResponseCache:
+    """
+    In-process TTL/LRU cache for deterministic API responses.
+
+    Entries are keyed by a SHA-256 of the endpoint URL and canonical JSON
+    payload, so identical requests short-circuit before any HTTP round trip.
+    The URL includes the service's base URL, so one cache can back clients
+    for several services.
+    Cached values are returned as-is; callers should not mutate them.
+    """
+
+    def __init__(self, ttl_seconds: float = 3600, max_size: int = 500):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Seconds before an entry expires
+            max_size: Maximum number of entries kept (least recently used evicted)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._store: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str, payload: Dict[str, Any]) -> str:
+        """Build a cache key from a full endpoint URL and request payload."""
+        if ORJSON_AVAILABLE:
+            canonical = orjson.dumps([url, payload], option=orjson.OPT_SORT_KEYS)
+        else:
+            canonical = json.dumps([url, payload], sort_keys=True).encode("utf-8")
+        return hashlib.sha256(canonical).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._store[key]
+                return None
+            self._store.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry on overflow."""
+        with self._lock:
+            self._store[key] = (time.monotonic(), value)
+            self._store.move_to_end(key)
+            while len(self._store) > self.max_size:
+                self._store.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._store.clear()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+
+class SemanticCache:
+    """
+    Embedding-based cache that matches paraphrased questions.
+
+    Each cached question is embedded once and stored as a normalized row in
+    a matrix; lookups take the cosine similarity against every row and
+    return the cached answer when the best match within the same scope
+    (endpoint plus non-text parameters) exceeds the threshold.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], Sequence[float]],
+        threshold: float = 0.95,
+        max_size: int = 500,
+        ttl_seconds: float = 3600,
+        embedding_cache_size: int = 1000
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            embed_fn: Function mapping text to an embedding vector
+            threshold: Minimum cosine similarity for a hit
+            max_size: Maximum number of entries kept (oldest dropped first)
+            ttl_seconds: Seconds before an entry expires
+            embedding_cache_size: Number of text embeddings memoized
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("SemanticCache requires numpy: pip install numpy")
+
+        self.embed_fn = embed_fn
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.embedding_cache_size = embedding_cache_size
+        self._vecs: Optional["np.ndarray"] = None
+        self._entries: List[tuple] = []
+        self._embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_sentence_transformers(
+        cls,
+        model_name: str = "all-MiniLM-L6-v2",
+        **kwargs
+    ) -> "SemanticCache":
+        """Create a cache that embeds locally with sentence-transformers."""
+        from sentence_transformers import SentenceTransformer
+
+        model = SentenceTransformer(model_name)
+        return cls(model.encode, **kwargs)
+
+    def _embed(self, text: str) -> "np.ndarray":
+        """Embed and normalize text, memoizing the result."""
+        import numpy as np
+
+        with self._lock:
+            vec = self._embeddings.get(text)
+            if vec is not None:
+                self._embeddings.move_to_end(text)
+                return vec
+
+        vec = np.asarray(self.embed_fn(text), dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        if norm:
+            vec = vec / norm
+
+        with self._lock:
+            self._embeddings[text] = vec
+            while len(self._embeddings) > self.embedding_cache_size:
+                self._embeddings.popitem(last=False)
+        return vec
+
+    def get(self, scope: str, text: str) -> Optional[Any]:
+        """Return the answer cached for a similar text in scope, or None."""
+        import numpy as np
+
+        vec = self._embed(text)
+        now = time.monotonic()
+
+        with self._lock:
+            if self._vecs is None:
+                return None
+            sims = self._vecs @ vec
+            for i in np.argsort(-sims):
+                if sims[i] < self.threshold:
+                    break
+                entry_scope, stored_at, value = self._entries[i]
+                if entry_scope == scope and now - stored_at <= self.ttl_seconds:
+                    return value
+        return None
+
+    def set(self, scope: str, text: str, value: Any) -> None:
+        """Store an answer for text, dropping the oldest entry on overflow."""
+        import numpy as np
+
+        vec = self._embed(text)
+
+        with self._lock:
+            row = vec[np.newaxis, :]
+            self._vecs = row if self._vecs is None else np.vstack([self._vecs, row])
+            self._entries.append((scope, time.monotonic(), value))
+            if len(self._entries) > self.max_size:
+                overflow = len(self._entries) - self.max_size
+                self._vecs = self._vecs[overflow:]
+                del self._entries[:overflow]
+
+    def clear(self) -> None:
+        """Drop all cached entries and embeddings."""
+        with self._lock:
+            self._vecs = None
+            self._entries.clear()
+            self._embeddings.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ClientMetrics:
+    """
+    Ring buffer of per-call timings and payload sizes.
+
+    Each record splits a call into send (request until the full body has
+    been received, covering connection, upload and server inference) and
+    parse (JSON decoding), plus the server's time-to-response as reported
+    by the HTTP library. Failed calls (HTTP errors, timeouts, undecodable
+    bodies) are recorded too, with the exception name in 'error'. Use
+    summary() to see which endpoints dominate and whether caching,
+    batching, compression or orjson would help.
+    """
+
+    def __init__(self, max_records: int = 1000):
+        """
+        Initialize the buffer.
+
+        Args:
+            max_records: Number of most recent calls kept
+        """
+        self._records: deque = deque(maxlen=max_records)
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        method: str,
+        path: str,
+        send_ns: int,
+        parse_ns: int,
+        bytes_in: int,
+        bytes_out: int,
+        elapsed_ms: Optional[float] = None,
+        status: Optional[int] = None,
+        error: Optional[str] = None
+    ) -> None:
+        """Record one call, successful or not."""
+        entry = {
+            "method": method,
+            "path": path,
+            "send_ms": send_ns / 1e6,
+            "parse_ms": parse_ns / 1e6,
+            "total_ms": (send_ns + parse_ns) / 1e6,
+            "elapsed_ms": elapsed_ms,
+            "bytes_in": bytes_in,
+            "bytes_out": bytes_out,
+            "status": status,
+            "error": error,
+        }
+        with self._lock:
+            self._records.append(entry)
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Return a snapshot of the recorded calls, oldest first."""
+        with self._lock:
+            return list(self._records)
+
+    def top(self, k: int = 10, by: str = "total_ms") -> List[Dict[str, Any]]:
+        """Return the k slowest (or largest, per 'by') recorded calls."""
+        return sorted(self.records(), key=lambda r: r[by] or 0, reverse=True)[:k]
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Aggregate recorded calls per 'METHOD path'."""
+        summary: Dict[str, Dict[str, float]] = {}
+        for r in self.records():
+            stats = summary.setdefault(f"{r['method']} {r['path']}", {
+                "count": 0,
+                "errors": 0,
+                "send_ms": 0.0,
+                "parse_ms": 0.0,
+                "max_total_ms": 0.0,
+                "bytes_in": 0,
+                "bytes_out": 0,
+            })
+            stats["count"] += 1
+            if r["error"]:
+                stats["errors"] += 1
+            stats["send_ms"] += r["send_ms"]
+            stats["parse_ms"] += r["parse_ms"]
+            stats["max_total_ms"] = max(stats["max_total_ms"], r["total_ms"])
+            stats["bytes_in"] += r["bytes_in"]
+            stats["bytes_out"] += r["bytes_out"]
+
+        for stats in summary.values():
+            stats["avg_send_ms"] = stats["send_ms"] / stats["count"]
+            stats["avg_parse_ms"] = stats["parse_ms"] / stats["count"]
+        return summary
+
+    def clear(self) -> None:
+        """Drop all records."""
+        with self._lock:
+            self._records.clear()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
 
 class LangChainClient:
     """Client for LangChain Service API."""
@@ -23,7 +647,16 @@ class LangChainClient:
     def __init__(
         self,
         base_url: str = "http://192.168.0.101:8002",
-        timeout: int = 120
+        timeout: int = 120,
+        cache: Optional[ResponseCache] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+        compress_requests: bool = False,
+        warm: bool = False,
+        shared: bool = False,
+        stream_mode: str = "auto",
+        backend: str = "requests",
+        coalesce: bool = False,
+        metrics: Optional[ClientMetrics] = None
     ):
         """
         Initialize the client.
@@ -31,31 +664,383 @@ class LangChainClient:
         Args:
             base_url: LangChain Service URL
             timeout: Request timeout in seconds
+            cache: Optional response cache for chat, rag_query, summarize,
+                analyze_logs and analyze_config (stateless calls only)
+            semantic_cache: Optional embedding cache that also matches
+                paraphrased chat, rag_query and summarize inputs
+            compress_requests: Gzip analyze_logs/analyze_config bodies over
+                GZIP_MIN_SIZE bytes; the service must accept
+                'Content-Encoding: gzip' request bodies (e.g. via a
+                decompressing middleware or reverse proxy)
+            warm: Open a keep-alive connection in a background thread so
+                the first real call skips the TCP/TLS handshake
+            shared: Use the process-wide Session (and its connection pool)
+                instead of allocating a new one (requests backend only)
+            stream_mode: chat_stream framing, one of STREAM_MODES
+            backend: HTTP library, "requests" or "httpx". httpx only
+                negotiates HTTP/2 (multiplexing concurrent calls over one
+                connection) over https:// with the h2 package installed;
+                against a plain http:// URL such as the default it speaks
+                HTTP/1.1. Both backends retry failed connects, but only
+                requests also retries 502/503 responses
+            coalesce: Share one in-flight request between this client's
+                threads issuing identical GETs or stateless calls. Off by
+                default: every caller receives the same decoded object, so
+                mutating a result would be visible to the others
+            metrics: Optional ClientMetrics that records per-call timings
         """
+        _check_stream_mode(stream_mode)
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}, got {backend!r}")
+        if backend == "httpx" and not HTTPX_AVAILABLE:
+            raise ImportError("The httpx backend requires httpx: pip install httpx")
+
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Content-Type": "application/json"
-        })
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+        self.compress_requests = compress_requests
+        self.stream_mode = stream_mode
+        self.coalesce = coalesce
+        # Identical requests currently on the wire from this client's threads
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self.metrics = metrics
+        self.backend = backend
+        self._client: Optional["httpx.Client"] = None
+        self.session: Optional["requests.Session"] = None
+        self._urls: Dict[str, str] = {}
+        self._owns_session = not shared
+
+        if backend == "httpx":
+            import httpx
+
+            # Connect retries match the requests backend's Retry(total=3)
+            transport = httpx.HTTPTransport(
+                http2=H2_AVAILABLE,
+                retries=3,
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32
+                )
+            )
+            self._client = httpx.Client(
+                base_url=self.base_url,
+                transport=transport,
+                timeout=timeout,
+                headers={"Content-Type": "application/json"}
+            )
+        else:
+            self.session = _get_shared_session() if shared else _make_tuned_session()
+            # httpx resolves paths against its own base_url
+            self._urls = {path: self.base_url + path for path in ENDPOINTS}
+        self._features: Optional[Dict[str, Any]] = None
+
+        # Pre-built payloads for the dominant stateless, default-config calls;
+        # key order matches the general path so cache/coalescing keys agree
+        self._default_chat_payload = {"message": None, "model_config": "general"}
+        self._default_rag_payload = {
+            "question": None,
+            "collection": "langchain_general",
+            "model_config": "general",
+            "k": 5
+        }
+
+        if warm:
+            threading.Thread(target=self._warm, daemon=True).start()
+
+    def _warm(self) -> None:
+        """Prime the connection pool with a health check, ignoring failures."""
+        try:
+            self._send("GET", "/health")
+        except _transport_errors():
+            pass
+
+    def _semantic_scope(
+        self,
+        path: str,
+        payload: Dict[str, Any],
+        text_field: str
+    ) -> str:
+        """Scope key covering the endpoint URL and every payload field but the text."""
+        params = {k: v for k, v in payload.items() if k != text_field}
+        return ResponseCache.make_key(self.base_url + path, params)
+
+    def _cache_keys(
+        self,
+        path: str,
+        payload: Dict[str, Any],
+        text_field: Optional[str]
+    ) -> tuple:
+        """
+        Compute the exact-cache key and semantic scope for a call, once.
+
+        Returns:
+            Tuple of (cache key or None, semantic scope or None)
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ResponseCache.make_key(self.base_url + path, payload)
+        scope = None
+        if self.semantic_cache is not None and text_field:
+            scope = self._semantic_scope(path, payload, text_field)
+        return cache_key, scope
+
+    def _cache_lookup(
+        self,
+        cache_key: Optional[str],
+        scope: Optional[str],
+        payload: Dict[str, Any],
+        text_field: Optional[str] = None
+    ) -> Optional[Any]:
+        """Check the exact cache, then the semantic cache, for a response."""
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        if scope is not None:
+            return self.semantic_cache.get(scope, payload[text_field])
+        return None
+
+    def _cache_store(
+        self,
+        cache_key: Optional[str],
+        scope: Optional[str],
+        payload: Dict[str, Any],
+        result: Any,
+        text_field: Optional[str] = None
+    ) -> None:
+        """Record a response in the configured caches."""
+        if cache_key is not None:
+            self.cache.set(cache_key, result)
+        if scope is not None:
+            self.semantic_cache.set(scope, payload[text_field], result)
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Any:
+        """Issue a request on the configured backend and return the checked response."""
+        if self._client is not None:
+            response = self._client.request(method, path, content=body, headers=headers)
+        else:
+            try:
+                url = self._urls[path]
+            except KeyError:
+                # Per-session routes (/memory/<id>/..., /conversations/<id>)
+                url = self.base_url + path
+            response = self.session.request(
+                method,
+                url,
+                data=body,
+                headers=headers,
+                timeout=self.timeout
+            )
+        response.raise_for_status()
+        return response
+
+    def _call(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Dict[str, Any]] = None,
+        key: Optional[str] = None,
+        cacheable: bool = False,
+        text_field: Optional[str] = None,
+        compress: bool = False
+    ) -> Any:
+        """
+        Perform one API call: cache lookup, encode, send, decode, cache store.
+
+        Args:
+            method: HTTP method
+            path: Endpoint path
+            payload: JSON body, if any
+            key: Return only this key of the decoded response
+            cacheable: Consult and populate the configured response caches
+            text_field: Payload field matched by the semantic cache
+            compress: Allow gzip of large bodies (if compress_requests is set)
+
+        Returns:
+            The decoded response, or response[key]
+        """
+        # Keys are hashed once per call and reused for the store below
+        cache_key, scope = None, None
+        if cacheable and (self.cache is not None or self.semantic_cache is not None):
+            cache_key, scope = self._cache_keys(path, payload, text_field)
+            cached = self._cache_lookup(cache_key, scope, payload, text_field)
+            if cached is not None:
+                return cached
+
+        body, headers = None, None
+        if payload is not None:
+            body, headers = _encode_body(payload, compress and self.compress_requests)
+
+        if self.coalesce and (cacheable or method == "GET"):
+            data = self._singleflight(method, path, body, headers)
+        else:
+            data = self._fetch(method, path, body, headers)
+        try:
+            result = data[key] if key else data
+        except (KeyError, TypeError):
+            raise _missing_field_error(path, key, self._client is not None) from None
+
+        if cache_key is not None or scope is not None:
+            self._cache_store(cache_key, scope, payload, result, text_field)
+        return result
+
+    def _fetch(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes],
+        headers: Optional[Dict[str, str]]
+    ) -> Any:
+        """Send a request and decode the response, recording metrics if enabled."""
+        if self.metrics is None:
+            return _decode_response(self._send(method, path, body, headers))
+
+        t0 = time.perf_counter_ns()
+        response, t1 = None, None
+        try:
+            response = self._send(method, path, body, headers)
+            t1 = time.perf_counter_ns()
+            data = _decode_response(response)
+        except _transport_errors() as e:
+            # Slow 5xx and timeouts belong in the profile as much as successes
+            _record_failure(self.metrics, method, path, response, body, e, t0, t1)
+            raise
+        t2 = time.perf_counter_ns()
+        _record_metrics(self.metrics, method, path, response, body, t1 - t0, t2 - t1)
+        return data
+
+    def _singleflight(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes],
+        headers: Optional[Dict[str, str]]
+    ) -> Any:
+        """Send a request, or wait on an identical one already in flight."""
+        flight_key = _flight_key(method, path, body)
+        with self._inflight_lock:
+            future = self._inflight.get(flight_key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[flight_key] = future
+
+        if not leader:
+            # The leader shares this client's timeout and always resolves
+            # the future, so waiting on it is bounded the same way
+            try:
+                return future.result()
+            except CancelledError:
+                # The leader thread was interrupted; send the request here
+                return self._fetch(method, path, body, headers)
+
+        try:
+            data = self._fetch(method, path, body, headers)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(flight_key, None)
+            # No-op once resolved; on KeyboardInterrupt/SystemExit it releases
+            # the followers without re-raising the interrupt in their threads
+            future.cancel()
+
+    def _supports(self, feature: str) -> bool:
+        """
+        Check whether the service advertises a feature in /info.
+
+        A successful probe is cached for the client's lifetime; a failed one
+        reports the feature as unsupported and is retried on the next call.
+        """
+        if self._features is None:
+            try:
+                self._features = self.info().get("features", {})
+            except _transport_errors():
+                return False
+        return bool(self._features.get(feature))
+
+    def map(
+        self,
+        fn: Callable[[Any], Any],
+        iterable: Iterable[Any],
+        workers: int = 8,
+        ordered: bool = True
+    ) -> Iterator[Any]:
+        """
+        Run a client method over many inputs concurrently from sync code.
+
+        Threads overlap the network waits while sharing this client's
+        connection pool; a Session is safe to use from several threads for
+        independent requests as long as the pool is large enough
+        (pool_maxsize is 64), so keep workers at or below that.
+
+        Args:
+            fn: Callable taking one item, e.g. client.summarize
+            iterable: Inputs to process
+            workers: Number of worker threads
+            ordered: Yield results in input order (False yields them as
+                they complete)
+
+        Yields:
+            fn(item) for each item
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            if ordered:
+                yield from executor.map(fn, iterable)
+            else:
+                futures = [executor.submit(fn, item) for item in iterable]
+                for future in as_completed(futures):
+                    yield future.result()
+
+    @classmethod
+    def shared(cls, base_url: str = "http://192.168.0.101:8002") -> "LangChainClient":
+        """
+        Return the process-wide client for base_url.
+
+        Clients are created on first use and backed by the shared Session,
+        so repeated lookups (e.g. one per web request) reuse keep-alive
+        connections instead of building a new pool each time.
+        """
+        key = base_url.rstrip('/')
+        with _SHARED_LOCK:
+            client = _SHARED_CLIENTS.get(key)
+            if client is None:
+                client = cls(base_url=key, shared=True)
+                _SHARED_CLIENTS[key] = client
+            return client
+
+    def close(self) -> None:
+        """Close the underlying connection pool (unless it is shared)."""
+        if self._client is not None:
+            self._client.close()
+        elif self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> "LangChainClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def health(self) -> Dict[str, Any]:
         """Check service health."""
-        response = self.session.get(
-            f"{self.base_url}/health",
-            timeout=self.timeout
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._call("GET", "/health")
 
     def info(self) -> Dict[str, Any]:
         """Get service information."""
-        response = self.session.get(
-            f"{self.base_url}/info",
-            timeout=self.timeout
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._call("GET", "/info")
 
     def chat(
         self,
@@ -74,6 +1059,9 @@ class LangChainClient:
         Returns:
             The AI response text
         """
+        if not session_id and model_config == "general":
+            return self._chat_fast(message)
+
         payload = {
             "message": message,
             "model_config": model_config
@@ -81,13 +1069,58 @@ class LangChainClient:
         if session_id:
             payload["session_id"] = session_id
 
-        response = self.session.post(
-            f"{self.base_url}/chat",
-            json=payload,
-            timeout=self.timeout
+        return self._call(
+            "POST", "/chat", payload,
+            key="response",
+            cacheable=not session_id,
+            text_field="message"
         )
-        response.raise_for_status()
-        return response.json()["response"]
+
+    def _chat_fast(self, message: str) -> str:
+        """chat() for the default stateless case, filling a pre-built payload."""
+        payload = self._default_chat_payload.copy()
+        payload["message"] = message
+        return self._call(
+            "POST", "/chat", payload,
+            key="response",
+            cacheable=True,
+            text_field="message"
+        )
+
+    def chat_batch(
+        self,
+        messages: List[str],
+        model_config: str = "general"
+    ) -> List[str]:
+        """
+        Send several chat messages in one request.
+
+        Uses POST /chat/batch when the service advertises
+        features.batch_chat in /info, otherwise falls back to concurrent
+        chat() calls over the shared connection pool.
+
+        Args:
+            messages: Messages to send
+            model_config: Model configuration
+
+        Returns:
+            Responses in the same order as messages
+        """
+        if not messages:
+            return []
+        if not self._supports("batch_chat"):
+            return list(self.map(
+                lambda m: self.chat(m, model_config=model_config),
+                messages,
+                workers=16
+            ))
+
+        payload = {
+            "messages": messages,
+            "model_config": model_config
+        }
+
+        return self._call("POST", "/chat/batch", payload, key="responses")
 
     def chat_stream(
         self,
@@ -97,6 +1130,12 @@ class LangChainClient:
         """
         Stream a chat response.
 
+        Framing follows the client's stream_mode. Raw text is decoded
+        incrementally so multi-byte characters split across network reads
+        are reassembled; "lines" yields one item per line and "sse" yields
+        the payload of each data line. "auto" picks "sse" for
+        text/event-stream responses and "raw" otherwise.
+
         Args:
             message: The message to send
             model_config: Model configuration
@@ -109,17 +1148,70 @@ class LangChainClient:
             "model_config": model_config
         }
 
+        if self._client is not None:
+            yield from self._chat_stream_httpx(payload)
+            return
+
         response = self.session.post(
-            f"{self.base_url}/chat/stream",
-            json=payload,
+            self._urls["/chat/stream"],
+            data=_dumps(payload),
+            headers={"Accept": "text/event-stream, text/plain"},
             stream=True,
             timeout=self.timeout
         )
         response.raise_for_status()
-
+        response.raw.decode_content = True
+        mode = _resolve_stream_mode(self.stream_mode, response.headers.get("Content-Type"))
+
+        # chunk_size=None yields data as soon as it arrives instead of
+        # blocking until a fixed-size buffer fills.
+        if mode == "sse":
+            for line in response.iter_lines(chunk_size=None):
+                data = _sse_data(line)
+                if data is not None:
+                    yield data.decode("utf-8")
+            return
+
+        if mode == "lines":
+            for line in response.iter_lines(chunk_size=None):
+                yield line.decode("utf-8")
+            return
+
+        decoder = codecs.getincrementaldecoder("utf-8")()
         for chunk in response.iter_content(chunk_size=None):
             if chunk:
-                yield chunk.decode('utf-8')
+                text = decoder.decode(chunk)
+                if text:
+                    yield text
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+    def _chat_stream_httpx(self, payload: Dict[str, Any]) -> Generator[str, None, None]:
+        """chat_stream implementation for the httpx backend."""
+        with self._client.stream(
+            "POST",
+            "/chat/stream",
+            content=_dumps(payload),
+            headers={"Accept": "text/event-stream, text/plain"}
+        ) as response:
+            response.raise_for_status()
+            mode = _resolve_stream_mode(self.stream_mode, response.headers.get("Content-Type"))
+
+            if mode == "sse":
+                for line in response.iter_lines():
+                    data = _sse_data(line.encode("utf-8"))
+                    if data is not None:
+                        yield data.decode("utf-8")
+                return
+
+            if mode == "lines":
+                yield from response.iter_lines()
+                return
+
+            for chunk in response.iter_text():
+                if chunk:
+                    yield chunk
 
     def rag_query(
         self,
@@ -140,6 +1232,9 @@ class LangChainClient:
         Returns:
             Dict with 'answer' and 'sources'
         """
+        if collection == "langchain_general" and model_config == "general" and k == 5:
+            return self._rag_query_fast(question)
+
         payload = {
             "question": question,
             "collection": collection,
@@ -147,13 +1242,66 @@ class LangChainClient:
             "k": k
         }
 
-        response = self.session.post(
-            f"{self.base_url}/rag/query",
-            json=payload,
-            timeout=self.timeout
+        return self._call(
+            "POST", "/rag/query", payload,
+            cacheable=True,
+            text_field="question"
         )
-        response.raise_for_status()
-        return response.json()
+
+    def _rag_query_fast(self, question: str) -> Dict[str, Any]:
+        """rag_query() with all defaults, filling a pre-built payload."""
+        payload = self._default_rag_payload.copy()
+        payload["question"] = question
+        return self._call(
+            "POST", "/rag/query", payload,
+            cacheable=True,
+            text_field="question"
+        )
+
+    def rag_query_batch(
+        self,
+        questions: List[str],
+        collection: str = "langchain_general",
+        model_config: str = "general",
+        k: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several RAG queries in one request.
+
+        Uses POST /rag/query/batch when the service advertises
+        features.batch_rag, otherwise falls back to concurrent rag_query().
+
+        Args:
+            questions: Questions to ask
+            collection: Qdrant collection name
+            model_config: Model configuration
+            k: Number of documents to retrieve
+
+        Returns:
+            List of dicts with 'answer' and 'sources', in question order
+        """
+        if not questions:
+            return []
+        if not self._supports("batch_rag"):
+            return list(self.map(
+                lambda q: self.rag_query(
+                    q,
+                    collection=collection,
+                    model_config=model_config,
+                    k=k
+                ),
+                questions,
+                workers=16
+            ))
+
+        payload = {
+            "questions": questions,
+            "collection": collection,
+            "model_config": model_config,
+            "k": k
+        }
+
+        return self._call("POST", "/rag/query/batch", payload, key="results")
 
     def rag_conversational(
         self,
@@ -185,13 +1333,7 @@ class LangChainClient:
         if session_id:
             payload["session_id"] = session_id
 
-        response = self.session.post(
-            f"{self.base_url}/rag/conversational",
-            json=payload,
-            timeout=self.timeout
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._call("POST", "/rag/conversational", payload)
 
     def run_agent(
         self,
@@ -216,13 +1358,7 @@ class LangChainClient:
             "verbose": verbose
         }
 
-        response = self.session.post(
-            f"{self.base_url}/agent/run",
-            json=payload,
-            timeout=self.timeout
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._call("POST", "/agent/run", payload)
 
     def troubleshoot(
         self,
@@ -244,13 +1380,7 @@ class LangChainClient:
             "verbose": verbose
         }
 
-        response = self.session.post(
-            f"{self.base_url}/agent/troubleshoot",
-            json=payload,
-            timeout=self.timeout
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._call("POST", "/agent/troubleshoot", payload)
 
     def summarize(
         self,
@@ -275,13 +1405,54 @@ class LangChainClient:
             "model_config": model_config
         }
 
-        response = self.session.post(
-            f"{self.base_url}/summarize",
-            json=payload,
-            timeout=self.timeout
+        return self._call(
+            "POST", "/summarize", payload,
+            key="summary",
+            cacheable=True,
+            text_field="text"
         )
-        response.raise_for_status()
-        return response.json()["summary"]
+
+    def summarize_batch(
+        self,
+        texts: List[str],
+        prompt_type: str = "general",
+        model_config: str = "general"
+    ) -> List[str]:
+        """
+        Summarize several texts in one request.
+
+        Uses POST /summarize/batch when the service advertises
+        features.batch_summarize, otherwise falls back to concurrent
+        summarize().
+
+        Args:
+            texts: Texts to summarize
+            prompt_type: Type of summary (general, technical, log, config, incident)
+            model_config: Model configuration
+
+        Returns:
+            Summaries in the same order as texts
+        """
+        if not texts:
+            return []
+        if not self._supports("batch_summarize"):
+            return list(self.map(
+                lambda t: self.summarize(
+                    t,
+                    prompt_type=prompt_type,
+                    model_config=model_config
+                ),
+                texts,
+                workers=16
+            ))
+
+        payload = {
+            "texts": texts,
+            "prompt_type": prompt_type,
+            "model_config": model_config
+        }
+
+        return self._call("POST", "/summarize/batch", payload, key="summaries")
 
     def analyze_logs(
         self,
@@ -303,13 +1474,11 @@ class LangChainClient:
             "model_config": model_config
         }
 
-        response = self.session.post(
-            f"{self.base_url}/summarize/log",
-            json=payload,
-            timeout=self.timeout
+        return self._call(
+            "POST", "/summarize/log", payload,
+            cacheable=True,
+            compress=True
         )
-        response.raise_for_status()
-        return response.json()
 
     def analyze_config(
         self,
@@ -334,13 +1503,11 @@ class LangChainClient:
             "model_config": model_config
         }
 
-        response = self.session.post(
-            f"{self.base_url}/summarize/config",
-            json=payload,
-            timeout=self.timeout
+        return self._call(
+            "POST", "/summarize/config", payload,
+            cacheable=True,
+            compress=True
         )
-        response.raise_for_status()
-        return response.json()
 
     def create_memory(
         self,
@@ -365,13 +1532,7 @@ class LangChainClient:
             **kwargs
         }
 
-        response = self.session.post(
-            f"{self.base_url}/memory/create",
-            json=payload,
-            timeout=self.timeout
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._call("POST", "/memory/create", payload)
 
     def get_memory_history(self, session_id: str) -> List[Dict[str, str]]:
         """
@@ -383,12 +1544,19 @@ class LangChainClient:
         Returns:
             List of message dicts
         """
-        response = self.session.get(
-            f"{self.base_url}/memory/{session_id}/history",
-            timeout=self.timeout
-        )
-        response.raise_for_status()
-        return response.json()["history"]
+        return self._call("GET", "/memory/" + session_id + "/history", key="history")
+
+    def iter_memory_history(self, session_id: str) -> Iterator[Dict[str, str]]:
+        """
+        Stream conversation history for a session.
+
+        Args:
+            session_id: Session identifier
+
+        Yields:
+            Message dicts, decoded one at a time when the service sends NDJSON
+        """
+        return self._iter_ndjson("/memory/" + session_id + "/history", "history")
 
     def clear_memory(self, session_id: str) -> Dict[str, Any]:
         """
@@ -400,12 +1568,7 @@ class LangChainClient:
         Returns:
             Confirmation dict
         """
-        response = self.session.delete(
-            f"{self.base_url}/memory/{session_id}/clear",
-            timeout=self.timeout
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._call("DELETE", "/memory/" + session_id + "/clear")
 
     def list_conversations(self) -> List[Dict[str, Any]]:
         """
@@ -414,12 +1577,58 @@ class LangChainClient:
         Returns:
             List of conversation metadata
         """
-        response = self.session.get(
-            f"{self.base_url}/conversations",
-            timeout=self.timeout
-        )
-        response.raise_for_status()
-        return response.json()["conversations"]
+        return self._call("GET", "/conversations", key="conversations")
+
+    def iter_conversations(self) -> Iterator[Dict[str, Any]]:
+        """
+        Stream stored conversations.
+
+        Yields:
+            Conversation metadata, decoded one at a time when the service
+            sends NDJSON (otherwise from the regular JSON listing)
+        """
+        return self._iter_ndjson("/conversations", "conversations")
+
+    def _iter_ndjson(self, path: str, key: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate a listing endpoint item by item.
+
+        Asks for application/x-ndjson and decodes one line at a time, so
+        peak memory stays flat regardless of the listing size. Servers that
+        answer with a plain JSON document fall back to iterating its key.
+        """
+        headers = {"Accept": "application/x-ndjson, application/json"}
+
+        if self._client is not None:
+            with self._client.stream("GET", path, headers=headers) as response:
+                response.raise_for_status()
+                if _is_ndjson(response.headers.get("Content-Type")):
+                    for line in response.iter_lines():
+                        if line:
+                            yield _loads(line)
+                    return
+                response.read()
+                data = _decode_response(response)
+        else:
+            with self.session.get(
+                self.base_url + path,
+                headers=headers,
+                stream=True,
+                timeout=self.timeout
+            ) as response:
+                response.raise_for_status()
+                if _is_ndjson(response.headers.get("Content-Type")):
+                    for line in response.iter_lines(chunk_size=NDJSON_CHUNK_SIZE):
+                        if line:
+                            yield _loads(line)
+                    return
+                data = _decode_response(response)
+
+        try:
+            items = data[key]
+        except (KeyError, TypeError):
+            raise _missing_field_error(path, key, self._client is not None) from None
+        yield from items
 
     def get_conversation(self, session_id: str) -> Dict[str, Any]:
         """
@@ -431,12 +1640,7 @@ class LangChainClient:
         Returns:
             Conversation data
         """
-        response = self.session.get(
-            f"{self.base_url}/conversations/{session_id}",
-            timeout=self.timeout
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._call("GET", "/conversations/" + session_id)
 
     def delete_conversation(self, session_id: str) -> Dict[str, Any]:
         """
@@ -448,12 +1652,551 @@ class LangChainClient:
         Returns:
             Confirmation dict
         """
-        response = self.session.delete(
-            f"{self.base_url}/conversations/{session_id}",
-            timeout=self.timeout
+        return self._call("DELETE", "/conversations/" + session_id)
+
+    def batch(self, ops: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Run several memory/conversation operations in one request.
+
+        Server contract: POST /batch with {"ops": [...]} where each op is
+        {"op": "<name>", ...arguments} and <name> is one of BATCH_OPS
+        (create_memory, clear_memory, delete_conversation); the response is
+        {"results": [...]} in op order. The service advertises support via
+        features.batch_ops in /info. Without it, ops run concurrently as
+        individual calls over the connection pool.
+
+        Args:
+            ops: Operations, e.g. [{"op": "clear_memory", "session_id": "a"}]
+
+        Returns:
+            One result dict per op, in order
+        """
+        if not ops:
+            return []
+        for op in ops:
+            if op.get("op") not in BATCH_OPS:
+                raise ValueError(f"Unsupported batch op: {op.get('op')!r}")
+        if not self._supports("batch_ops"):
+            return list(self.map(self._run_op, ops, workers=16))
+
+        return self._call("POST", "/batch", {"ops": ops}, key="results")
+
+    def _run_op(self, op: Dict[str, Any]) -> Any:
+        """Execute one batch op, validated by batch(), as an individual call."""
+        args = {k: v for k, v in op.items() if k != "op"}
+        return getattr(self, op["op"])(**args)
+
+    def clear_memories(self, session_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Clear memory for several sessions in one batch.
+
+        Args:
+            session_ids: Session identifiers
+
+        Returns:
+            Confirmation dicts, in session order
+        """
+        return self.batch([
+            {"op": "clear_memory", "session_id": session_id}
+            for session_id in session_ids
+        ])
+
+    def delete_conversations(self, session_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Delete several conversations in one batch.
+
+        Args:
+            session_ids: Session identifiers
+
+        Returns:
+            Confirmation dicts, in session order
+        """
+        return self.batch([
+            {"op": "delete_conversation", "session_id": session_id}
+            for session_id in session_ids
+        ])
+
+
+class AsyncLangChainClient:
+    """
+    Async client for LangChain Service API.
+
+    Mirrors LangChainClient on top of httpx.AsyncClient so that many
+    long-running LLM calls can be awaited concurrently on one event loop.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://192.168.0.101:8002",
+        timeout: int = 120,
+        max_connections: int = 64,
+        compress_requests: bool = False,
+        stream_mode: str = "auto",
+        coalesce: bool = False,
+        metrics: Optional[ClientMetrics] = None
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            base_url: LangChain Service URL
+            timeout: Request timeout in seconds
+            max_connections: Maximum concurrent connections in the pool
+            compress_requests: Gzip large analyze_logs/analyze_config bodies
+                (see LangChainClient)
+            stream_mode: chat_stream framing, one of STREAM_MODES
+            coalesce: Share one in-flight request between coroutines issuing
+                identical GETs or stateless calls. Off by default, since
+                every caller receives the same decoded object
+            metrics: Optional ClientMetrics that records per-call timings
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError("AsyncLangChainClient requires httpx: pip install httpx")
+        _check_stream_mode(stream_mode)
+        import httpx
+
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.compress_requests = compress_requests
+        self.stream_mode = stream_mode
+        self.coalesce = coalesce
+        self.metrics = metrics
+        # Check-and-insert never awaits, so the event loop needs no lock here
+        self._inflight: Dict[str, "asyncio.Task"] = {}
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            headers={"Content-Type": "application/json"},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections // 2,
+                keepalive_expiry=60
+            )
         )
-        response.raise_for_status()
-        return response.json()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncLangChainClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _call(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Dict[str, Any]] = None,
+        key: Optional[str] = None,
+        stateless: bool = False,
+        compress: bool = False
+    ) -> Any:
+        """
+        Perform one API call and return the decoded response (or response[key]).
+
+        GETs and calls marked stateless are coalesced with identical
+        requests already in flight when coalesce is enabled.
+        """
+        body, headers = None, None
+        if payload is not None:
+            body, headers = _encode_body(payload, compress and self.compress_requests)
+
+        if self.coalesce and (stateless or method == "GET"):
+            data = await self._singleflight(method, path, body, headers)
+        else:
+            data = await self._fetch(method, path, body, headers)
+        try:
+            return data[key] if key else data
+        except (KeyError, TypeError):
+            raise _missing_field_error(path, key, True) from None
+
+    async def _fetch(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes],
+        headers: Optional[Dict[str, str]]
+    ) -> Any:
+        """Send a request and decode the response, recording metrics if enabled."""
+        if self.metrics is None:
+            response = await self._client.request(
+                method, path, content=body, headers=headers
+            )
+            response.raise_for_status()
+            return _decode_response(response)
+
+        t0 = time.perf_counter_ns()
+        response, t1 = None, None
+        try:
+            response = await self._client.request(
+                method, path, content=body, headers=headers
+            )
+            response.raise_for_status()
+            t1 = time.perf_counter_ns()
+            data = _decode_response(response)
+        except _transport_errors() as e:
+            _record_failure(self.metrics, method, path, response, body, e, t0, t1)
+            raise
+        t2 = time.perf_counter_ns()
+        _record_metrics(self.metrics, method, path, response, body, t1 - t0, t2 - t1)
+        return data
+
+    async def _singleflight(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes],
+        headers: Optional[Dict[str, str]]
+    ) -> Any:
+        """Send a request, or await an identical one already in flight."""
+        import asyncio
+
+        flight_key = _flight_key(method, path, body)
+        task = self._inflight.get(flight_key)
+        if task is None:
+            # The fetch runs as its own task so cancelling any one caller,
+            # including the one that started it, leaves the others waiting
+            task = asyncio.ensure_future(self._fetch(method, path, body, headers))
+            self._inflight[flight_key] = task
+            task.add_done_callback(
+                lambda done: self._flight_done(flight_key, done)
+            )
+        return await asyncio.shield(task)
+
+    def _flight_done(self, flight_key: str, task: "asyncio.Task") -> None:
+        """Forget a finished in-flight request."""
+        if self._inflight.get(flight_key) is task:
+            del self._inflight[flight_key]
+        # Mark the exception retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def health(self) -> Dict[str, Any]:
+        """Check service health."""
+        return await self._call("GET", "/health")
+
+    async def info(self) -> Dict[str, Any]:
+        """Get service information."""
+        return await self._call("GET", "/info")
+
+    async def chat(
+        self,
+        message: str,
+        model_config: str = "general",
+        session_id: Optional[str] = None
+    ) -> str:
+        """Send a chat message. See LangChainClient.chat."""
+        payload = {
+            "message": message,
+            "model_config": model_config
+        }
+        if session_id:
+            payload["session_id"] = session_id
+
+        return await self._call(
+            "POST", "/chat", payload,
+            key="response",
+            stateless=not session_id
+        )
+
+    async def chat_stream(
+        self,
+        message: str,
+        model_config: str = "general"
+    ) -> AsyncGenerator[str, None]:
+        """Stream a chat response. See LangChainClient.chat_stream."""
+        payload = {
+            "message": message,
+            "model_config": model_config
+        }
+
+        async with self._client.stream(
+            "POST",
+            "/chat/stream",
+            content=_dumps(payload),
+            headers={"Accept": "text/event-stream, text/plain"}
+        ) as response:
+            response.raise_for_status()
+            mode = _resolve_stream_mode(self.stream_mode, response.headers.get("Content-Type"))
+
+            if mode == "sse":
+                async for line in response.aiter_lines():
+                    data = _sse_data(line.encode("utf-8"))
+                    if data is not None:
+                        yield data.decode("utf-8")
+                return
+
+            if mode == "lines":
+                async for line in response.aiter_lines():
+                    yield line
+                return
+
+            async for chunk in response.aiter_text():
+                if chunk:
+                    yield chunk
+
+    async def chat_many(
+        self,
+        messages: List[str],
+        model_config: str = "general",
+        concurrency: int = 8
+    ) -> List[str]:
+        """
+        Send several chat messages concurrently.
+
+        Args:
+            messages: Messages to send
+            model_config: Model configuration
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            Responses in the same order as messages
+        """
+        import asyncio
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(message: str) -> str:
+            async with semaphore:
+                return await self.chat(message, model_config=model_config)
+
+        return await asyncio.gather(*[one(m) for m in messages])
+
+    async def rag_query(
+        self,
+        question: str,
+        collection: str = "langchain_general",
+        model_config: str = "general",
+        k: int = 5
+    ) -> Dict[str, Any]:
+        """Query with RAG. See LangChainClient.rag_query."""
+        payload = {
+            "question": question,
+            "collection": collection,
+            "model_config": model_config,
+            "k": k
+        }
+
+        return await self._call("POST", "/rag/query", payload, stateless=True)
+
+    async def rag_query_many(
+        self,
+        questions: List[str],
+        collection: str = "langchain_general",
+        model_config: str = "general",
+        k: int = 5,
+        concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """Run several RAG queries concurrently, preserving order."""
+        import asyncio
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(question: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.rag_query(
+                    question,
+                    collection=collection,
+                    model_config=model_config,
+                    k=k
+                )
+
+        return await asyncio.gather(*[one(q) for q in questions])
+
+    async def rag_conversational(
+        self,
+        question: str,
+        collection: str = "langchain_general",
+        session_id: Optional[str] = None,
+        model_config: str = "general",
+        k: int = 5
+    ) -> Dict[str, Any]:
+        """Conversational RAG query. See LangChainClient.rag_conversational."""
+        payload = {
+            "question": question,
+            "collection": collection,
+            "model_config": model_config,
+            "k": k
+        }
+        if session_id:
+            payload["session_id"] = session_id
+
+        return await self._call("POST", "/rag/conversational", payload)
+
+    async def run_agent(
+        self,
+        task: str,
+        agent_type: str = "devops",
+        verbose: bool = False
+    ) -> Dict[str, Any]:
+        """Run an agent task. See LangChainClient.run_agent."""
+        payload = {
+            "task": task,
+            "agent_type": agent_type,
+            "verbose": verbose
+        }
+
+        return await self._call("POST", "/agent/run", payload)
+
+    async def troubleshoot(
+        self,
+        issue: str,
+        verbose: bool = False
+    ) -> Dict[str, Any]:
+        """NOC troubleshooting workflow. See LangChainClient.troubleshoot."""
+        payload = {
+            "issue": issue,
+            "verbose": verbose
+        }
+
+        return await self._call("POST", "/agent/troubleshoot", payload)
+
+    async def summarize(
+        self,
+        text: str,
+        prompt_type: str = "general",
+        model_config: str = "general"
+    ) -> str:
+        """Summarize text content. See LangChainClient.summarize."""
+        payload = {
+            "text": text,
+            "prompt_type": prompt_type,
+            "model_config": model_config
+        }
+
+        return await self._call(
+            "POST", "/summarize", payload,
+            key="summary",
+            stateless=True
+        )
+
+    async def summarize_many(
+        self,
+        texts: List[str],
+        prompt_type: str = "general",
+        model_config: str = "general",
+        concurrency: int = 8
+    ) -> List[str]:
+        """Summarize several texts concurrently, preserving order."""
+        import asyncio
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(text: str) -> str:
+            async with semaphore:
+                return await self.summarize(
+                    text,
+                    prompt_type=prompt_type,
+                    model_config=model_config
+                )
+
+        return await asyncio.gather(*[one(t) for t in texts])
+
+    async def analyze_logs(
+        self,
+        log_content: str,
+        model_config: str = "general"
+    ) -> Dict[str, Any]:
+        """Analyze log content. See LangChainClient.analyze_logs."""
+        payload = {
+            "log_content": log_content,
+            "model_config": model_config
+        }
+
+        return await self._call(
+            "POST", "/summarize/log", payload,
+            stateless=True,
+            compress=True
+        )
+
+    async def analyze_config(
+        self,
+        config_content: str,
+        config_type: str = "generic",
+        model_config: str = "general"
+    ) -> Dict[str, Any]:
+        """Analyze configuration content. See LangChainClient.analyze_config."""
+        payload = {
+            "config_content": config_content,
+            "config_type": config_type,
+            "model_config": model_config
+        }
+
+        return await self._call(
+            "POST", "/summarize/config", payload,
+            stateless=True,
+            compress=True
+        )
+
+    async def create_memory(
+        self,
+        session_id: str,
+        memory_type: str = "buffer",
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Create a memory session. See LangChainClient.create_memory."""
+        payload = {
+            "session_id": session_id,
+            "memory_type": memory_type,
+            **kwargs
+        }
+
+        return await self._call("POST", "/memory/create", payload)
+
+    async def get_memory_history(self, session_id: str) -> List[Dict[str, str]]:
+        """Get conversation history for a session."""
+        return await self._call("GET", "/memory/" + session_id + "/history", key="history")
+
+    async def iter_memory_history(self, session_id: str) -> AsyncGenerator[Dict[str, str], None]:
+        """Stream conversation history for a session. See LangChainClient.iter_memory_history."""
+        async for item in self._iter_ndjson("/memory/" + session_id + "/history", "history"):
+            yield item
+
+    async def clear_memory(self, session_id: str) -> Dict[str, Any]:
+        """Clear memory for a session."""
+        return await self._call("DELETE", "/memory/" + session_id + "/clear")
+
+    async def list_conversations(self) -> List[Dict[str, Any]]:
+        """List all stored conversations."""
+        return await self._call("GET", "/conversations", key="conversations")
+
+    async def iter_conversations(self) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream stored conversations. See LangChainClient.iter_conversations."""
+        async for item in self._iter_ndjson("/conversations", "conversations"):
+            yield item
+
+    async def _iter_ndjson(self, path: str, key: str) -> AsyncGenerator[Dict[str, Any], None]:
+        """Iterate a listing endpoint item by item. See LangChainClient._iter_ndjson."""
+        async with self._client.stream(
+            "GET",
+            path,
+            headers={"Accept": "application/x-ndjson, application/json"}
+        ) as response:
+            response.raise_for_status()
+            if _is_ndjson(response.headers.get("Content-Type")):
+                async for line in response.aiter_lines():
+                    if line:
+                        yield _loads(line)
+                return
+            await response.aread()
+            data = _decode_response(response)
+
+        try:
+            items = data[key]
+        except (KeyError, TypeError):
+            raise _missing_field_error(path, key, True) from None
+        for item in items:
+            yield item
+
+    async def get_conversation(self, session_id: str) -> Dict[str, Any]:
+        """Get a specific conversation."""
+        return await self._call("GET", "/conversations/" + session_id)
+
+    async def delete_conversation(self, session_id: str) -> Dict[str, Any]:
+        """Delete a conversation."""
+        return await self._call("DELETE", "/conversations/" + session_id)
 
 
 # CLI interface
@@ -570,6 +2313,6 @@ if __name__ == "__main__":
             summary = client.summarize(text, prompt_type=args.prompt_type)
             print(summary)
 
-    except requests.exceptions.RequestException as e:
+    except _transport_errors() as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)